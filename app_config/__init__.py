@@ -1 +1 @@
-from .app_config import UserConfig
\ No newline at end of file
+from .app_config import UserConfig
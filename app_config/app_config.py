@@ -1,99 +1,206 @@
-# Import necessary modules
-import configparser
+import os
+import logging
+from PyQt5 import QtCore
+
+logger = logging.getLogger(__name__)
+
+# Parsed settings files, keyed by path, as (modification time in ns, settings) tuples
+# shared by every UserConfig instance
+_CONFIG_CACHE = {}
+
+# Section that holds every user setting in 'settings.ini'
+_SECTION = 'user_settings'
+
+# Delay used to coalesce back-to-back saves into a single write (milliseconds)
+_FLUSH_DELAY_MS = 250
+
+
+def _parse_ini(path):
+    """
+    Reads a flat INI file into a dictionary in a single pass.
+
+    'settings.ini' only ever holds one section with a couple of keys, so section
+    headers, comments and blank lines are skipped and every `key = value` line is
+    stored as strings.
+
+    Args:
+        path (str): The path to the INI file.
+
+    Returns:
+        dict: The settings found in the file, or an empty dict if the file does not exist.
+    """
+    settings = {}
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return settings
+
+    for line in data.splitlines():
+        line = line.strip()
+        if not line or line.startswith((b'#', b';', b'[')):
+            continue
+        key, sep, value = line.partition(b'=')
+        if sep:
+            settings[key.strip().decode('utf-8')] = value.strip().decode('utf-8')
+    return settings
+
+
+def _mtime_ns(path):
+    """
+    Returns the modification time of a file in nanoseconds, or None if it does not exist.
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 
 # User Configuration Class
 class UserConfig:
     """
     A class to manage application configuration and user settings.
 
-    This class uses the `configparser` module to read and write user settings
-    to a configuration file named 'settings.ini'. It provides functionality
-    to load settings on initialization and save updated settings back to the file.
+    This class reads and writes user settings to a configuration file named
+    'settings.ini'. It provides functionality to load settings on initialization
+    and save updated settings back to the file.
+
+    The parsed file is cached in memory, so the save methods only update the
+    in-memory settings, mark them dirty and (re)start a short single-shot timer.
+    The file itself is written by `flush()` once the timer fires, so a burst of
+    saves results in a single write. `flush()` is also called when the application quits.
 
     Attributes:
-        config (ConfigParser): An instance of ConfigParser to manage configuration data.
+        settings (dict): The `user_settings` values as strings, keyed by setting name.
         last_selected_port (int): The last selected port, defaulting to 0 if not specified in the configuration.
 
     Methods:
         __init__():
-            Initializes the AppConfig instance, loads settings from 'settings.ini',
+            Initializes the UserConfig instance, loads settings from 'settings.ini',
             and sets default values for user settings if not present.
-        save_user_settings():
-            Saves the current user settings to 'settings.ini'.
+        save_user_last_port_settings():
+            Stores the last selected port and data point names and schedules a flush.
+        save_data_point_names_settings():
+            Stores the data point names and schedules a flush.
+        flush():
+            Writes the settings to 'settings.ini' if they have changed.
     """
 
-    def __init__(self, shared_config):
+    def __init__(self, shared_config, path='settings.ini'):
         """
-        Initializes the AppConfig instance.
+        Initializes the UserConfig instance.
 
         This method reads the configuration file 'settings.ini' and loads user settings.
         If the file or specific settings are not present, it sets default values.
+        The parsed file is cached and only parsed again if its modification time has changed.
         """
-        self.config = configparser.ConfigParser()
-        self.config.read('settings.ini')
-        
+        self.path = path
+        mtime = _mtime_ns(path)
+        cached = _CONFIG_CACHE.get(path)
+        if cached is not None and cached[0] == mtime:
+            self.settings = cached[1]
+        else:
+            self.settings = _parse_ini(path)
+            _CONFIG_CACHE[path] = (mtime, self.settings)
+        self._dirty = False  # True when in-memory settings may differ from the file
+        self._last_persisted = dict(self.settings)  # Settings as last read from or written to the file
+        self._flush_timer = None  # Created on first save, on the GUI thread
+
         self.shared_config = shared_config  # Store the shared configuration instance
-        
-        if 'user_settings' in self.config:
-            # Convert values to integers where necessary
-            self.shared_config.last_selected_port = int(self.config['user_settings'].get('selected_port', 0))
-            print(f"Last selected port: {self.shared_config.last_selected_port}")
-            data_point_names = self.config['user_settings'].get('data_point_names', '')
+
+        if self.settings:
+            # Convert values to integers where necessary; an empty value counts as unset
+            self.shared_config.last_selected_port = int(self.settings.get('selected_port') or 0)
+            logger.debug("Last selected port: %s", self.shared_config.last_selected_port)
+            data_point_names = self.settings.get('data_point_names', '')
             if data_point_names:
-                self.shared_config.dataPointNames = data_point_names.split(',')
+                # Skip empty entries left by stray commas
+                self.shared_config.dataPointNames = [name for name in data_point_names.split(',') if name]
+                self.shared_config.dataPointNameSet = set(self.shared_config.dataPointNames)
             else:
-                print("No data point names found in settings, initializing empty list.")
+                logger.debug("No data point names found in settings, initializing empty list.")
+
 
-    
     def save_user_last_port_settings(self):
         """
-        Saves the current user settings to 'settings.ini'.
+        Stores the current user settings for the next flush to 'settings.ini'.
 
-        This method updates the configuration file with the latest user settings,
+        This method updates the in-memory settings with the latest user settings,
         ensuring that all values are converted to strings before saving.
         """
-        print("Saving user settings...")  # Debug statement
-
-        if 'user_settings' not in self.config:
-            self.config['user_settings'] = {}
+        logger.debug("Saving user settings...")
 
         # Convert all values to strings before saving
-        self.config['user_settings']['selected_port'] = str(self.shared_config.last_selected_port)
-        self.config['user_settings']['data_point_names'] = ','.join(self.shared_config.dataPointNames)
-        # Debug print to verify the values being saved
-        print("Config to save:", dict(self.config['user_settings']))
-        # Print the user settings that are about to be saved for debugging purposes.
-
-        # Write the settings to the file
-        with open('settings.ini', 'w') as configfile:
-            self.config.write(configfile)
-        # Save the configuration settings to the 'settings.ini' file.
-
-        print("Settings saved!")
-        # Print a confirmation message indicating that the settings have been successfully saved.
-    
+        self.settings['selected_port'] = str(self.shared_config.last_selected_port)
+        self.settings['data_point_names'] = ','.join(self.shared_config.dataPointNames)
+        # Log the values being saved; only formatted when debug logging is enabled
+        logger.debug("Config to save: %s", self.settings)
+
+        # Coalesce with any other save made in the next few hundred milliseconds
+        self._schedule_flush()
+
     def save_data_point_names_settings(self):
         """
-        Saves the current user settings to 'settings.ini'.
+        Stores the current data point names for the next flush to 'settings.ini'.
 
-        This method updates the configuration file with the latest user settings,
+        This method updates the in-memory settings with the latest user settings,
         ensuring that all values are converted to strings before saving.
         """
-        print("Saving user settings...")  # Debug statement
-
-        if 'user_settings' not in self.config:
-            self.config['user_settings'] = {}
+        logger.debug("Saving user settings...")
 
         # Convert all values to strings before saving
-        self.config['user_settings']['data_point_names'] = ','.join(self.shared_config.dataPointNames)
-        # Debug print to verify the values being saved
-        print("Config to save:", dict(self.config['user_settings']))
-        # Print the user settings that are about to be saved for debugging purposes.
-
-        # Write the settings to the file
-        with open('settings.ini', 'w') as configfile:
-            self.config.write(configfile)
-        # Save the configuration settings to the 'settings.ini' file.
-
-        print("Settings saved!")
-        # Print a confirmation message indicating that the settings have been successfully saved.
\ No newline at end of file
+        self.settings['data_point_names'] = ','.join(self.shared_config.dataPointNames)
+        # Log the values being saved; only formatted when debug logging is enabled
+        logger.debug("Config to save: %s", self.settings)
+
+        # Coalesce with any other save made in the next few hundred milliseconds
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """
+        Marks the settings dirty and (re)starts the single-shot flush timer.
+
+        Saves made within `_FLUSH_DELAY_MS` of each other are written together.
+        """
+        self._dirty = True
+        if self._flush_timer is None:
+            self._flush_timer = QtCore.QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(_FLUSH_DELAY_MS)
+            self._flush_timer.timeout.connect(self.flush)
+        self._flush_timer.start()
+
+    def flush(self):
+        """
+        Writes the settings to 'settings.ini' if any value changed since the last write.
+
+        Called by the flush timer, and connected to `QApplication.aboutToQuit` so
+        pending settings are saved on exit without waiting for the timer.
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+        if not self._dirty:
+            return
+
+        # Skip the write if the saves only re-stored the values already on disk
+        if self.settings == self._last_persisted:
+            self._dirty = False
+            return
+
+        # Serialize the settings as a single INI section
+        lines = [f"[{_SECTION}]"]
+        lines.extend(f"{key} = {value}" for key, value in self.settings.items())
+        content = '\n'.join(lines) + '\n\n'
+
+        # Write everything in one call to a temporary file, then swap it in so a
+        # crash mid-write never leaves a truncated 'settings.ini' behind
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as configfile:
+            configfile.write(content)
+        os.replace(tmp_path, self.path)
+        self._last_persisted = dict(self.settings)
+        # The cached settings now match the file, so record its new modification time
+        _CONFIG_CACHE[self.path] = (_mtime_ns(self.path), self.settings)
+        self._dirty = False
+
+        logger.debug("Settings saved to %s", self.path)
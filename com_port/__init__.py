@@ -1,2 +1,4 @@
 # Optionally, you can expose SerialReaderThread directly in the package namespace
-from .com_port import ComPort
\ No newline at end of file
+from .com_port import ComPort
+from .port_scanner import PortScanner
+from .device_watcher import DeviceChangeFilter
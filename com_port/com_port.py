@@ -19,11 +19,12 @@ class ComPort:
         manufacturer (str or None): The manufacturer of the COM port (e.g., "FTDI").
         product (str or None): The product name of the COM port (e.g., "USB Serial Port").
         interface (str or None): The interface type of the COM port (e.g., "UART").
-
-    Methods:
-        UIString():
-            Returns a formatted string representation of the COM port for display in the UI.
+        UIString (str): A formatted string representation of the COM port for display in the UI.
     """
+    # Fixed attribute layout: no per-instance __dict__ for each enumerated port
+    __slots__ = ('device', 'name', 'description', 'hwid', 'vid', 'pid', 'serial_number',
+                 'location', 'manufacturer', 'product', 'interface', 'UIString')
+
     def __init__(self, comport):
         """
         Initializes a ComPort instance with the details of the provided COM port.
@@ -47,6 +48,7 @@ class ComPort:
             manufacturer (str or None): The manufacturer of the COM port.
             product (str or None): The product name of the COM port.
             interface (str or None): The interface type of the COM port.
+            UIString (str): The name and description of the COM port, computed once for display.
         """
         self.device = comport.device  # The device path (e.g., COM3)
         self.name = comport.name  # The name of the COM port
@@ -60,15 +62,6 @@ class ComPort:
         self.product = comport.product  # The product name of the COM port
         self.interface = comport.interface  # The interface type of the COM port
 
-    @property
-    def UIString(self):
-        """
-        Returns a formatted string representation of the COM port for display in the UI.
-
-        The string includes the name and description of the COM port, making it easier
-        for users to identify the port in a dropdown or list.
-
-        Returns:
-            str: A formatted string combining the name and description of the COM port.
-        """
-        return f"{self.name} - {self.description}"
\ No newline at end of file
+        # Combine the name and description once, making it easier for users to
+        # identify the port in a dropdown or list
+        self.UIString = f"{self.name} - {self.description}"
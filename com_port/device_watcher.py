@@ -0,0 +1,65 @@
+from PyQt5 import QtCore
+
+# Windows message sent to top-level windows when hardware is added or removed
+WM_DEVICECHANGE = 0x0219
+# WM_DEVICECHANGE events that can change the list of COM ports
+DBT_DEVNODES_CHANGED = 0x0007
+DBT_DEVICEARRIVAL = 0x8000
+DBT_DEVICEREMOVECOMPLETE = 0x8004
+_PORT_CHANGE_EVENTS = (DBT_DEVNODES_CHANGED, DBT_DEVICEARRIVAL, DBT_DEVICEREMOVECOMPLETE)
+
+
+# Device Change Signals Class
+class DeviceChangeSignals(QtCore.QObject):
+    """
+    Signals emitted by a DeviceChangeFilter.
+
+    QAbstractNativeEventFilter is not a QObject and cannot declare signals itself,
+    so the filter owns an instance of this class instead.
+
+    Signals:
+        changed: Emitted when a device has been added or removed.
+    """
+    changed = QtCore.pyqtSignal()
+
+
+# Device Change Filter Class
+class DeviceChangeFilter(QtCore.QAbstractNativeEventFilter):
+    """
+    Watches the native Windows event stream for WM_DEVICECHANGE messages.
+
+    Windows broadcasts WM_DEVICECHANGE to every top-level window when a device is
+    plugged in or removed, so the COM ports only need to be enumerated again when
+    `signals.changed` fires instead of on a short polling interval. The filter does
+    nothing on other platforms, where Qt never delivers Windows messages.
+
+    Attributes:
+        signals (DeviceChangeSignals): Holds the `changed` signal.
+    """
+    def __init__(self):
+        """
+        Initializes the DeviceChangeFilter and its signals.
+        """
+        super(DeviceChangeFilter, self).__init__()
+        self.signals = DeviceChangeSignals()
+        self._msg_type = None  # ctypes MSG structure, resolved on the first native event
+
+    def nativeEventFilter(self, eventType, message):
+        """
+        Emits `signals.changed` for WM_DEVICECHANGE messages that affect the port list.
+
+        Args:
+            eventType (QByteArray): The kind of native event, b"windows_generic_MSG" for window messages.
+            message (sip.voidptr): Pointer to the native MSG structure.
+
+        Returns:
+            tuple: (False, 0), so the event is always passed on to Qt.
+        """
+        if eventType == b"windows_generic_MSG":
+            if self._msg_type is None:
+                from ctypes import wintypes  # Windows only; imported once the first message arrives
+                self._msg_type = wintypes.MSG
+            msg = self._msg_type.from_address(int(message))
+            if msg.message == WM_DEVICECHANGE and msg.wParam in _PORT_CHANGE_EVENTS:
+                self.signals.changed.emit()
+        return False, 0
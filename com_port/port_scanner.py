@@ -0,0 +1,42 @@
+from PyQt5 import QtCore
+
+
+# Port Scan Signals Class
+class PortScanSignals(QtCore.QObject):
+    """
+    Signals emitted by a PortScanner.
+
+    QRunnable is not a QObject and cannot declare signals itself, so the scanner
+    owns an instance of this class instead.
+
+    Signals:
+        finished (list): Emitted with the result of `list_ports.comports()`.
+    """
+    finished = QtCore.pyqtSignal(list)
+
+
+# Port Scanner Class
+class PortScanner(QtCore.QRunnable):
+    """
+    Enumerates the available COM ports on a QThreadPool worker thread.
+
+    `list_ports.comports()` can block for hundreds of milliseconds on Windows, so
+    running it on the GUI thread stalls the event loop. The result is delivered
+    through `signals.finished`, which Qt queues back to the GUI thread.
+
+    Attributes:
+        signals (PortScanSignals): Holds the `finished` signal.
+    """
+    def __init__(self):
+        """
+        Initializes the PortScanner and its signals on the calling (GUI) thread.
+        """
+        super(PortScanner, self).__init__()
+        self.signals = PortScanSignals()
+
+    def run(self):
+        """
+        Enumerates the COM ports and emits the result.
+        """
+        from serial.tools import list_ports  # Imported on first use, off the start-up path
+        self.signals.finished.emit(list_ports.comports())
@@ -9,14 +9,12 @@ Classes:
 
 Functions:
     main():
-        Initializes the application and starts the event loop.
-
-Attributes:
-    shared_config (SharedConfig): Instance of SharedConfig used to share data across components.
+        Creates the shared configuration, initializes the application and starts the event loop.
 """
 
 import sys
-from PyQt5 import QtGui, QtWidgets
+import concurrent.futures
+from PyQt5 import QtWidgets
 from app_config import UserConfig
 from views.Main_Window import MainWindow
 from table_model.table_model import tracked_data_table_model
@@ -32,10 +30,13 @@ class SharedConfig:
 
     Attributes:
         BAUD_RATE (int): Default baud rate for serial communication.
-        date_queue_dict (dict): Dictionary for storing timestamped serial data.
-        app_config (UserConfig): Instance of the UserConfig class for managing user settings.
-        com_ports (dict): Dictionary for storing available COM ports and their details.
+        MAX_SAMPLES_PER_DATA_POINT (int): Number of timestamped samples kept for each data point.
+        date_queue_dict (dict): Bounded deque of timestamped serial data for each data point name.
+        app_config (UserConfig): Instance of the UserConfig class for managing user settings, set by main().
+        com_ports (list): Available COM ports (ComPort objects), in the same order as the port dropdown.
         dataPointNames (list): List to store names of data points.
+        dataPointNameSet (set): The same names as dataPointNames, for fast lookups of received
+            lines; rebuilt whenever the list changes.
         last_selected_port (int): Index of the last selected COM port.
         tracked_data_table_model (tracked_data_table_model): Table model for tracking data points.
     """
@@ -44,30 +45,38 @@ class SharedConfig:
         Initializes the SharedConfig instance.
 
         - Sets default values for baud rate, COM ports, and other shared settings.
-        - Creates an instance of UserConfig for managing user-specific settings.
+        - Leaves app_config unset; main() loads the UserConfig in the background.
         - Initializes the tracked data table model for storing and visualizing data points.
         """
         self.BAUD_RATE = 115200  # Default baud rate
-        self.date_queue_dict = {}  # Dictionary for timestamped serial data        
-        self.com_ports = {}  # Dictionary for available COM ports
+        self.MAX_SAMPLES_PER_DATA_POINT = 100_000  # Oldest samples are dropped beyond this
+        self.date_queue_dict = {}  # Data point name -> deque of timestamped serial data
+        self.com_ports = []  # Available COM ports, indexed like the port dropdown
         self.dataPointNames = []  # List to store names of data points
+        self.dataPointNameSet = set()  # Set of the names in dataPointNames
         self.last_selected_port = 0  # Last selected COM port index
-        self.app_config = UserConfig(self)  # User configuration instance
+        self.app_config = None  # User configuration instance, loaded by main()
         self.tracked_data_table_model = tracked_data_table_model()  # Table model for tracking data points
 
-# Create a shared configuration instance
-shared_config = SharedConfig()
-
 # Main Entry Point
 def main():
     """
     Initializes and runs the serial monitor GUI application.
 
-    - Creates the QApplication instance required for PyQt5.
+    - Creates the SharedConfig instance used to share data across components.
+    - Loads the user settings on a worker thread while the QApplication instance is created.
     - Instantiates the MainWindow, which sets up the UI and logic.
+    - Flushes pending user settings to disk when the application quits.
     - Starts the application's event loop to handle user interaction.
     """
-    app = QtWidgets.QApplication(sys.argv)  # Create the PyQt5 application instance
+    shared_config = SharedConfig()  # Created here so importing this module has no side effects
+
+    # Read settings.ini in the background so the file I/O overlaps with Qt's start-up
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        user_config_future = executor.submit(UserConfig, shared_config)
+        app = QtWidgets.QApplication(sys.argv)  # Create the PyQt5 application instance
+        shared_config.app_config = user_config_future.result()  # Wait for the settings before building the UI
+    app.aboutToQuit.connect(shared_config.app_config.flush)  # Write settings once on exit
     window = MainWindow(shared_config)  # Instantiate the main window with shared configuration
     sys.exit(app.exec_())  # Start the application's event loop
 
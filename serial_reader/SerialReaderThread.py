@@ -1,124 +1,154 @@
-import threading
-import serial
-from datetime import datetime
+import logging
+import time
+from PyQt5 import QtCore
+
+logger = logging.getLogger(__name__)
+
+# A batch of lines is emitted once it holds this many lines...
+_BATCH_MAX_LINES = 64
+# ...or once this long (seconds) has passed since the last emit, whichever comes first
+_BATCH_MAX_AGE_S = 0.03
+# A partial line is passed on as it is once it grows to this many bytes without a newline
+_MAX_PARTIAL_LINE_BYTES = 65536
 
 # Serial Reader Thread Class
-class SerialReaderThread(threading.Thread):
+class SerialReaderThread(QtCore.QThread):
     """
     SerialReaderThread Class
 
     SerialReaderThread is a background thread responsible for reading data from a serial port
     and passing it to the main application for processing.
 
+    Received lines are delivered through the `linesReady` signal in batches, each line paired
+    with the time its data was read from the port. When it is
+    connected to a slot on a GUI object, Qt queues the call onto the GUI thread, so widgets and
+    the data they show are never touched from the reader thread, which only reads and decodes.
+
     Attributes:
-        shared_config (SharedConfig): Shared configuration object containing application-wide settings.
+        linesReady (pyqtSignal(list)): Emitted with a batch of (received, line) tuples, where `line`
+            is a non-empty decoded line and `received` the `time.time()` at which it was read.
         serial_port (serial.Serial): Serial port object used for communication.
-        running (bool): Flag indicating whether the thread is actively reading data.
-        callback (function): A callback function to process data received from the serial port.
 
     Methods:
-        __init__(shared_config, serial_port, callback):
-            Initializes the SerialReaderThread with the shared configuration, serial port object, and callback function.
+        __init__(serial_port):
+            Initializes the SerialReaderThread with the serial port object.
 
         run():
             Continuously reads data from the serial port while the thread is running.
 
         stop():
-            Stops the thread by setting the running flag to False.
+            Asks the thread to stop and wakes it from a blocking read.
     """
-    def __init__(self, shared_config, serial_port, callback):
+    linesReady = QtCore.pyqtSignal(list)
+
+    def __init__(self, serial_port):
         """
-        Initializes the SerialReaderThread with the shared configuration, serial port object, and callback function.
+        Initializes the SerialReaderThread with the serial port object.
 
         Args:
-            shared_config (SharedConfig): Shared configuration object containing application-wide settings.
             serial_port (serial.Serial): Serial port object used for communication.
-            callback (function): A callback function to process data received from the serial port.
 
         Workflow:
-            - Stores the shared configuration and serial port object.
-            - Sets the running flag to True to indicate the thread is active.
-            - Initializes the callback function for processing data.
+            - Stores the serial port object.
         """
         super(SerialReaderThread, self).__init__()
-        self.shared_config = shared_config
         self.serial_port = serial_port
-        self.running = True
-        self.callback = callback  # Callback function to process data if needed
-                
-        print(f"SerialReaderThread initialized with serial port: {self.serial_port.portstr}")
+        self._buffer = bytearray()  # Bytes received after the last complete line
+
+        logger.debug("SerialReaderThread initialized with serial port: %s", self.serial_port.portstr)
 
     def run(self):
         """
         Continuously reads data from the serial port while the thread is running.
 
         Workflow:
-            - Reads data from the serial port using the `readline` method.
-            - Decodes the raw data using UTF-8 encoding.
-            - Passes the decoded data to the callback function or shared configuration for processing.
+            - Reads every byte the driver has buffered in a single `read` call.
+            - Decodes all complete lines in the receive buffer at once, as ASCII when they are plain
+              ASCII and as UTF-8 otherwise, replacing invalid bytes.
+            - Keeps a trailing partial line in the buffer until the rest of it arrives. Like `readline`,
+              passes it on when a read times out first, so prompts such as the MicroPython REPL's
+              '>>> ' are shown. It is also passed on once it reaches `_MAX_PARTIAL_LINE_BYTES`, so a
+              device that never sends a newline cannot grow the buffer without limit.
+            - Collects the lines into a batch, each paired with the time its chunk was read, so
+              timestamps do not depend on batching or on how busy the GUI thread is.
+            - Emits the batch through `linesReady` once it holds `_BATCH_MAX_LINES` lines, once
+              `_BATCH_MAX_AGE_S` has passed since the last emit, or as soon as no more data is waiting.
 
         Notes:
             - Handles exceptions gracefully to ensure the thread does not crash unexpectedly.
-            - Stops reading if the serial port is closed or the `running` flag is set to False.
+            - Stops reading if the serial port is closed or `stop` has requested an interruption.
         """
-        while self.running and self.serial_port.is_open:
+        lines = []  # (received, line) tuples not yet emitted
+        last_emit = time.monotonic()
+        while not self.isInterruptionRequested() and self.serial_port.is_open:
             try:
-                # Read a line of data from the serial port
-                raw_line = self.serial_port.readline()
-
-                # Attempt to decode the data using UTF-8 encoding
-                try:
-                    line = raw_line.decode('utf-8').strip()  # Decode using UTF-8
-                    encoding = 'utf-8'
-                except UnicodeDecodeError:
-                    # If UTF-8 decoding fails, fall back to ASCII encoding
-                    line = raw_line.decode('ascii', errors='ignore').strip()
-                    encoding = 'ascii'
-
-                # If the line is not empty, pass it to the callback function
-                if line:
-                    self.callback(f"{line}")  # Send the decoded line to the callback
-                    # Record the data point with a timestamp
-                    self.record_data_points(line)  # Record the data point with a timestamp
-                    
+                # Read whatever has arrived, waiting (up to the port timeout) for at least one byte
+                chunk = self.serial_port.read(self.serial_port.in_waiting or 1)
+                if chunk:
+                    # Time of arrival, taken here rather than when the GUI thread handles the batch
+                    received = time.time()
+                    self._buffer += chunk
+
+                    # Take every complete line out of the buffer; a partial line waits for the next read,
+                    # unless it has grown too long to keep waiting for its newline
+                    end = self._buffer.rfind(b'\n') + 1
+                    if len(self._buffer) - end >= _MAX_PARTIAL_LINE_BYTES:
+                        end = len(self._buffer)
+                elif self._buffer:
+                    # The read timed out with a partial line waiting, e.g. the REPL prompt '>>> ';
+                    # pass it on as readline() did instead of holding it until the next newline
+                    received = time.time()
+                    end = len(self._buffer)
+                else:
+                    end = 0
+
+                if end:
+                    # Decode all complete lines in one call. Microcontroller output is nearly always
+                    # plain ASCII, which is checked and copied without the UTF-8 decoder; anything
+                    # else is decoded as UTF-8, with invalid bytes becoming U+FFFD instead of raising
+                    complete = self._buffer[:end]
+                    del self._buffer[:end]
+                    if complete.isascii():
+                        text = complete.decode('ascii')
+                    else:
+                        text = complete.decode('utf-8', errors='replace')
+
+                    # Split on '\n' only, like readline(); splitlines() would also break lines at
+                    # '\r', form feeds and other separators. Strip in C and drop empty lines. A line
+                    # completed by this chunk is stamped with this read, even if it started earlier
+                    lines.extend((received, line) for line in map(str.strip, text.split('\n')) if line)
+
+                # Send the batch once it is big or old enough, or as soon as no more data is waiting
+                if lines:
+                    now = time.monotonic()
+                    if (len(lines) >= _BATCH_MAX_LINES or now - last_emit >= _BATCH_MAX_AGE_S
+                            or not self.serial_port.in_waiting):
+                        self.linesReady.emit(lines)
+                        lines = []
+                        last_emit = now
+
             except Exception as e:
-                # If an error occurs, send the error message to the callback
-                self.callback(f"Error: {str(e)}")
+                # If an error occurs, send what was received and then the error message
+                if lines:
+                    self.linesReady.emit(lines)
+                    lines = []
+                self.linesReady.emit([(time.time(), f"Error: {str(e)}")])
                 break  # Exit the loop on error
 
+        # Deliver anything still pending when the thread is stopped
+        if lines:
+            self.linesReady.emit(lines)
+
     def stop(self):
         """
-        Stops the thread by setting the running flag to False.
+        Asks the thread to stop and wakes it from a blocking read.
 
+        - Requests an interruption, which the read loop checks on every iteration.
+        - Cancels a pending read, so the thread exits without waiting for the port timeout.
         - Ensures the thread exits gracefully.
         """
-        self.running = False
-    
-    def record_data_points(self, line):
-        """
-        Records data points with a timestamp.
-
-        - Appends the data to the shared configuration's date_queue_dict with the current timestamp.
-        """
-        # Only record if there are data point names available
-        if len(self.shared_config.dataPointNames) != 0:
-            #check if line contians a comma
-            if ',' in line:
-                data = line.split(',')
-                if data[0] in self.shared_config.dataPointNames:
-                    found_data_name = data[0]
-                    found_data_point = data[1]
-                    found_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-                    
-                    print(f"Recording data point: {found_data_name} with value: {found_data_point} at {found_timestamp}")
-                    
-                    datapoint = {found_data_point, found_timestamp}
-                    
-                    #if date_queue_dict contains found_data_name as key then update add the datapoint to its' list
-                    if found_data_name in self.shared_config.date_queue_dict:
-                        self.shared_config.date_queue_dict[found_data_name].append(datapoint)
-                    else:
-                        self.shared_config.date_queue_dict[found_data_name] = [datapoint]
-                        
-                    # Update the tracked data table model
-                    self.shared_config.tracked_data_table_model.addRow(found_timestamp, found_data_name, found_data_point)
+        self.requestInterruption()
+        try:
+            self.serial_port.cancel_read()
+        except AttributeError:
+            pass  # cancel_read() needs pyserial 3.1 or later; the read then ends at the timeout
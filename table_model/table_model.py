@@ -1,5 +1,14 @@
-from PyQt5.QtCore import QAbstractTableModel, Qt, QModelIndex, QPersistentModelIndex, pyqtSignal
+from PyQt5.QtCore import QAbstractTableModel, Qt, QModelIndex, QTimer, pyqtSignal
 import csv
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Minimum time between two chartDataUpdated signals (milliseconds)
+_CHART_UPDATE_DELAY_MS = 60
+
+# Qt.DisplayRole as a plain int; views call data() for many roles per cell on every repaint
+_DISPLAY_ROLE = int(Qt.DisplayRole)
 
 class tracked_data_table_model(QAbstractTableModel):
     """
@@ -11,6 +20,8 @@ class tracked_data_table_model(QAbstractTableModel):
     Attributes:
         data (list): A list of lists representing the rows and columns of the table.
         headers (list): A list of strings representing the column headers.
+        ts_index (dict): Maps each timestamp to the index of its latest row.
+        header_index (dict): Maps each header to the index of its column.
         view (QTableView or None): A reference to the view using this model, allowing callbacks.
 
     Methods:
@@ -31,8 +42,14 @@ class tracked_data_table_model(QAbstractTableModel):
 
         addHeader(new_header):
             Dynamically adds a new header and updates the model.
+
+        addRow(time_stamp, data_point_name, data_value):
+            Updates or adds the row for a single sample.
+
+        addRows(samples):
+            Updates or adds the rows for a batch of samples, notifying the view once.
     """
-    chartDataUpdated = pyqtSignal()  # Signal to notify that chart data has been updated
+    chartDataUpdated = pyqtSignal()  # Signal to notify that chart data has been updated (throttled)
 
     def __init__(self):
         """
@@ -44,8 +61,12 @@ class tracked_data_table_model(QAbstractTableModel):
         super(tracked_data_table_model, self).__init__()
         self._rows = []  # Use a private attribute for rows
         self._headers = []  # Use a private attribute for headers
+        self._ts_index = {}  # Timestamp -> index of its latest row in _rows
+        self._header_index = {}  # Header -> index of its column in _headers
         self.addHeader("Timestamp")  # Add a default header for timestamps
         self.view = None  # Placeholder for the view using this model
+        self._chart_dirty = False  # True while a chartDataUpdated signal is pending
+        self._chart_timer = None  # Created on first use, on the GUI thread
 
     def getRows(self):
         """
@@ -56,6 +77,15 @@ class tracked_data_table_model(QAbstractTableModel):
         """
         return self._rows
 
+    def getHeaders(self):
+        """
+        Returns the column headers of the table model.
+
+        Returns:
+            list: The column headers of the table model.
+        """
+        return self._headers
+
     def setView(self, view):
         """
         Sets the view that will use this model.
@@ -91,7 +121,7 @@ class tracked_data_table_model(QAbstractTableModel):
         """
         return len(self._headers)
 
-    def data(self, index, role=Qt.DisplayRole):
+    def data(self, index, role=_DISPLAY_ROLE):
         """
         Returns the data for a specific cell in the model.
 
@@ -102,11 +132,12 @@ class tracked_data_table_model(QAbstractTableModel):
         Returns:
             Any: The data for the cell, or None if the role is not Qt.DisplayRole.
         """
-        if role == Qt.DisplayRole:
-            return self._rows[index.row()][index.column()]
-        return None
+        # Every other role is answered first, with a single int comparison
+        if role != _DISPLAY_ROLE:
+            return None
+        return self._rows[index.row()][index.column()]
 
-    def headerData(self, section, orientation, role=Qt.DisplayRole):
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
         """
         Returns the header data for a specific row or column.
 
@@ -118,12 +149,12 @@ class tracked_data_table_model(QAbstractTableModel):
         Returns:
             str: The header data for the specified section and orientation.
         """
-        if role == Qt.DisplayRole:
-            if orientation == Qt.Horizontal:
-                return self._headers[section]  # Return column headers
-            else:
-                return f"Row {section + 1}"  # Return row numbers as strings
-        return None
+        if role != _DISPLAY_ROLE:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section]  # Return column headers
+        else:
+            return f"Row {section + 1}"  # Return row numbers as strings
 
     def addHeader(self, new_header):
         """
@@ -136,8 +167,9 @@ class tracked_data_table_model(QAbstractTableModel):
         - Updates existing rows to include the new column.
         - Emits signals to notify the view about the change.
         """
-        print(f"Adding new header: {new_header}")
+        logger.debug("Adding new header: %s", new_header)
         try:
+            self._header_index[new_header] = len(self._headers)
             self._headers.append(new_header)
             newColumn = self.columnCount()
             self.beginInsertColumns(QModelIndex(), newColumn, newColumn)
@@ -147,58 +179,128 @@ class tracked_data_table_model(QAbstractTableModel):
             self.endInsertColumns()
             
         except Exception as e:
-            print(f"Error adding header: {e}")
+            logger.error("Error adding header: %s", e)
         
 
     def addRow(self, time_stamp, data_point_name, data_value):
         """
-        Updates a row with the matching timestamp or adds a new row if no match exists.
+        Updates a row with the matching timestamp or adds a new row if no match exists, or if
+        that row already holds a value for the data point.
 
         Args:
             time_stamp (str): The timestamp to search for.
             data_point_name (str): The column name to update or add.
             data_value (any): The value to set in the column.
         """
-        print(f"Adding/updating row with timestamp: {time_stamp}, data point: {data_point_name}, value: {data_value}")
-        
-        # Ensure the data_point_name exists in the headers
-        if data_point_name not in self._headers:
-            print(f"Header '{data_point_name}' not found, adding it.")
-            self.addHeader(data_point_name)
-
-        print(f"Current headers: {self._headers}")
-        # Search for a row with the matching timestamp
-        for row_index, row in enumerate(self._rows):
-            if row[0] == time_stamp:  # Assuming timestamp is in the first column
-                # Update the value in the corresponding column
-                column_index = self._headers.index(data_point_name)
-                if len(row) <= column_index:
-                    row.extend([None] * (column_index - len(row) + 1))  # Extend row if necessary
-                row[column_index] = data_value
+        self.addRows([(time_stamp, data_point_name, data_value)])
+
+    def addRows(self, samples):
+        """
+        Applies a batch of samples, updating rows with matching timestamps and adding new rows.
+
+        A sample whose data point already has a value in the row for its timestamp starts a new
+        row instead of overwriting it. Lines read from the port in one chunk share a timestamp,
+        so several samples of the same data point often arrive with the same one.
 
-                # Notify the view about the data change
-                top_left = self.index(row_index, column_index)
-                bottom_right = self.index(row_index, column_index)
-                self.dataChanged.emit(top_left, bottom_right)
-
-                # Emit the chart update signal
-                self.chartDataUpdated.emit()
-                return
-
-        # If no matching row is found, add a new row
-        new_row = [None] * len(self._headers)
-        new_row[0] = time_stamp  # Set the timestamp in the first column
-        column_index = self._headers.index(data_point_name)
-        new_row[column_index] = data_value
-        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows))
-        self._rows.append(new_row)
-        self.endInsertRows()
-        if self.view is not None:
+        Rows and columns are found through the timestamp and header indexes, so the cost
+        does not grow with the size of the table. The view is notified once per batch
+        instead of once per sample: all new rows are inserted together, and a single
+        `dataChanged` covers every existing cell that was updated.
+
+        Args:
+            samples (list): (time_stamp, data_point_name, data_value) tuples, in arrival order.
+        """
+        if not samples:
+            return
+        # Only formatted when debug logging is enabled
+        logger.debug("Adding/updating %d samples, first: %s", len(samples), samples[0])
+
+        # Ensure every data_point_name exists in the headers
+        header_index = self._header_index
+        for _, data_point_name, _ in samples:
+            if data_point_name not in header_index:
+                logger.debug("Header '%s' not found, adding it.", data_point_name)
+                self.addHeader(data_point_name)
+
+        rows = self._rows
+        ts_index = self._ts_index
+        column_count = len(self._headers)
+        first_new_row = len(rows)
+        new_rows = []
+        # Bounding box of the updated cells of existing rows
+        min_row = min_column = None
+        max_row = max_column = -1
+
+        for time_stamp, data_point_name, data_value in samples:
+            column_index = header_index[data_point_name]
+            row_index = ts_index.get(time_stamp)
+            if row_index is not None:
+                if row_index >= first_new_row:
+                    row = new_rows[row_index - first_new_row]
+                else:
+                    row = rows[row_index]
+                if row[column_index] is not None:
+                    # The row already holds a sample of this data point; keep it and start a new row
+                    row_index = None
+
+            if row_index is None:
+                # No matching row with a free cell yet, so start a new one
+                new_row = [None] * column_count
+                new_row[0] = time_stamp  # Set the timestamp in the first column
+                new_row[column_index] = data_value
+                ts_index[time_stamp] = first_new_row + len(new_rows)
+                new_rows.append(new_row)
+            elif row_index >= first_new_row:
+                # Row added earlier in this batch; the insert below covers it
+                row[column_index] = data_value
+            else:
+                # Fill the value in the corresponding column of an existing row
+                row[column_index] = data_value
+                if min_row is None or row_index < min_row:
+                    min_row = row_index
+                if min_column is None or column_index < min_column:
+                    min_column = column_index
+                max_row = max(max_row, row_index)
+                max_column = max(max_column, column_index)
+
+        if new_rows:
+            self.beginInsertRows(QModelIndex(), first_new_row, first_new_row + len(new_rows) - 1)
+            rows.extend(new_rows)
+            self.endInsertRows()
+
+        # Notify the view about the data change
+        if min_row is not None:
+            self.dataChanged.emit(self.index(min_row, min_column), self.index(max_row, max_column))
+
+        if new_rows and self.view is not None:
             self.view.autoScroll()
 
-        # Emit the chart update signal
+        # Schedule the chart update signal
+        self._schedule_chart_update()
+
+    def _schedule_chart_update(self):
+        """
+        Schedules a single chartDataUpdated signal for all changes made in the next few milliseconds.
+
+        Charts redraw on this signal, so it is coalesced instead of being emitted for every batch.
+        """
+        if self._chart_dirty:
+            return
+        self._chart_dirty = True
+        if self._chart_timer is None:
+            self._chart_timer = QTimer()
+            self._chart_timer.setSingleShot(True)
+            self._chart_timer.setInterval(_CHART_UPDATE_DELAY_MS)
+            self._chart_timer.timeout.connect(self._emit_chart_update)
+        self._chart_timer.start()
+
+    def _emit_chart_update(self):
+        """
+        Emits the pending chartDataUpdated signal.
+        """
+        self._chart_dirty = False
         self.chartDataUpdated.emit()
-        
+
     def saveDataToFile(self, file_path="data.csv"):
         """
         Saves the current data of the model to a CSV file.
@@ -207,16 +309,16 @@ class tracked_data_table_model(QAbstractTableModel):
             file_path (str): The path to the CSV file. Defaults to 'data.csv'.
         """
         try:
-            with open(file_path, mode='w', newline='', encoding='utf-8') as file:
+            # A large buffer turns the many small row writes into a few big ones
+            with open(file_path, mode='w', newline='', encoding='utf-8', buffering=1 << 20) as file:
                 writer = csv.writer(file)
-                
+
                 # Write headers
                 writer.writerow(self._headers)
-                
-                # Write data rows
-                for row in self._rows:
-                    writer.writerow(row)
+
+                # Write data rows; writerows loops over them in C
+                writer.writerows(self._rows)
             
-            print(f"Data successfully saved to {file_path}")
+            logger.debug("Data successfully saved to %s", file_path)
         except Exception as e:
-            print(f"Error saving data to file: {e}")
+            logger.error("Error saving data to file: %s", e)
@@ -1,9 +1,17 @@
 import re
+import logging
 from PyQt5 import QtWidgets, uic
 from PyQt5.QtChart import QChart, QChartView, QLineSeries, QDateTimeAxis, QValueAxis
 from PyQt5.QtCore import Qt, QDateTime, QTimer
 from PyQt5.QtGui import QPainter
 
+logger = logging.getLogger(__name__)
+
+# Characters that are not allowed in a data point name
+_INVALID_NAME_CHARS = re.compile(r'[^a-zA-Z0-9_-]')
+# Translation table turning spaces into underscores
+_SPACE_TO_UNDERSCORE = str.maketrans(' ', '_')
+
 
 # Data View Window Class
 class DataViewWindow(QtWidgets.QMainWindow):
@@ -22,8 +30,9 @@ class DataViewWindow(QtWidgets.QMainWindow):
         """
         Initializes the DataViewWindow, sets up the UI, and connects UI elements to their handlers.
 
-        - Loads the UI from the 'Data_view_window.ui' file.
-        - Retrieves and initializes UI elements such as text areas and labels.
+        - Loads the UI from the 'Data_view_window.ui' file; `loadUi` binds every named widget
+          (input_name_text, data_tableView, tabWidget, ...) as an attribute of the window.
+        - Initializes UI elements such as text areas and labels.
         - Sets up event handlers for user input validation.
         """
         super(DataViewWindow, self).__init__()
@@ -31,22 +40,12 @@ class DataViewWindow(QtWidgets.QMainWindow):
         self.shared_config = shared_config
         self.sanitized_text = ''
 
-        # Get UI elements
-        self.input_name_text = self.findChild(QtWidgets.QPlainTextEdit, 'input_name_text')
-        self.preview_txt_label = self.findChild(QtWidgets.QLabel, 'preview_txt_label')
-        self.dataPointName_listWidget = self.findChild(QtWidgets.QListWidget, 'dataPointName_listWidget')
-        self.clear_names_button = self.findChild(QtWidgets.QPushButton, 'clear_names_button')
-        self.add_name_button = self.findChild(QtWidgets.QPushButton, 'add_name_button')
-        self.data_tableView = self.findChild(QtWidgets.QTableView, 'data_tableView')
-        self.auto_scroll_checkBox = self.findChild(QtWidgets.QCheckBox, 'auto_scroll_checkBox')
-        self.save_data_pushButton = self.findChild(QtWidgets.QPushButton, 'save_data_pushButton')
-        self.tabWidget = self.findChild(QtWidgets.QTabWidget, 'tabWidget')
-        self.Data_Points_comboBox = self.findChild(QtWidgets.QComboBox, 'Data_Points_comboBox')
-        self.container = self.findChild(QtWidgets.QWidget, "chart_placeholder_widget")
+        # Shorter names for UI elements; the rest are used under their names from the .ui file
+        self.container = self.chart_placeholder_widget
 
         # Scroll controls (from your UI)
-        self.scroll_back_button = self.findChild(QtWidgets.QPushButton, 'Scroll_back_button')
-        self.scroll_forward_button = self.findChild(QtWidgets.QPushButton, 'Scroll_forward_button')
+        self.scroll_back_button = self.Scroll_back_button
+        self.scroll_forward_button = self.Scroll_forward_button
 
         # --- Chart + view
         self.chart = QChart()
@@ -85,10 +84,8 @@ class DataViewWindow(QtWidgets.QMainWindow):
         )
         self.clear_names_button.clicked.connect(self.clearDataPointNames)
 
-        if self.scroll_back_button:
-            self.scroll_back_button.clicked.connect(self.on_scroll_back)
-        if self.scroll_forward_button:
-            self.scroll_forward_button.clicked.connect(self.on_scroll_forward)
+        self.scroll_back_button.clicked.connect(self.on_scroll_back)
+        self.scroll_forward_button.clicked.connect(self.on_scroll_forward)
 
         # Table model hookup
         self.data_tableView.setModel(self.shared_config.tracked_data_table_model)
@@ -127,20 +124,21 @@ class DataViewWindow(QtWidgets.QMainWindow):
             if item.text() in self.shared_config.dataPointNames:
                 removedItem = item.text()
                 self.shared_config.dataPointNames.remove(removedItem)
+                self.shared_config.dataPointNameSet = set(self.shared_config.dataPointNames)
                 self.resetDataPointNames()
                 # if item.text() is a key in date_queue_dict, remove it
                 if removedItem in self.shared_config.date_queue_dict:
-                    print(f"Removing '{removedItem}' from date_queue_dict")
+                    logger.debug("Removing '%s' from date_queue_dict", removedItem)
                     del self.shared_config.date_queue_dict[removedItem]
 
     def validateNameText(self):
         """
         Validates the text entered in the input_name_text field and updates the preview label.
         """
-        # Replace spaces with underscores first
-        self.sanitized_text = self.input_name_text.toPlainText().replace(' ', '_')
-        # Remove any character that is not alphanumeric, underscore, or hyphen
-        self.sanitized_text = re.sub(r'[^a-zA-Z0-9_-]', '', self.sanitized_text)
+        # Replace spaces with underscores first, then remove any character that is not
+        # alphanumeric, underscore, or hyphen
+        text = self.input_name_text.toPlainText().translate(_SPACE_TO_UNDERSCORE)
+        self.sanitized_text = _INVALID_NAME_CHARS.sub('', text)
         self.preview_txt_label.setText(self.sanitized_text)
 
     def addDataPointName(self):
@@ -149,6 +147,7 @@ class DataViewWindow(QtWidgets.QMainWindow):
         """
         if self.sanitized_text not in self.shared_config.dataPointNames:
             self.shared_config.dataPointNames.append(self.sanitized_text)
+            self.shared_config.dataPointNameSet = set(self.shared_config.dataPointNames)
             self.resetDataPointNames()
             self.input_name_text.clear()
             self.preview_txt_label.clear()
@@ -165,6 +164,7 @@ class DataViewWindow(QtWidgets.QMainWindow):
         Clears all data point names from the list.
         """
         self.shared_config.dataPointNames.clear()
+        self.shared_config.dataPointNameSet = set()
         self.dataPointName_listWidget.clear()
 
     def resetDataPointNames(self):
@@ -189,7 +189,7 @@ class DataViewWindow(QtWidgets.QMainWindow):
         Automatically scrolls the data_tableView to the bottom.
         """
         if self.auto_scroll_checkBox.isChecked():
-            print("Auto-scrolling to bottom of data table view.")
+            logger.debug("Auto-scrolling to bottom of data table view.")
             self.data_tableView.scrollToBottom()
 
     def disableAutoScroll(self):
@@ -197,7 +197,7 @@ class DataViewWindow(QtWidgets.QMainWindow):
         Disables the auto-scroll checkbox when the scroll bar is manually triggered.
         """
         if not self.isScrolledToBottom():
-            print("Scroll bar is at the bottom, enabling auto-scroll.")
+            logger.debug("Scroll bar is not at the bottom, disabling auto-scroll.")
             self.auto_scroll_checkBox.setChecked(False)
 
     def save_data_pushButton_clicked(self):
@@ -227,55 +227,38 @@ class DataViewWindow(QtWidgets.QMainWindow):
 
     # ---------- Chart building + live refresh ----------
 
-    def buildSeriesFromModel(self):
+    def buildSeriesFromSamples(self):
         """
-        Rebuilds all series from the table model rows.
+        Rebuilds all series from the samples recorded in shared_config.date_queue_dict.
+        The table model keeps the values as received text for display and CSV export, while
+        date_queue_dict holds numeric values as floats, so the chart does not convert them.
         Does NOT create axes. Callers must attach axes after adding series.
         Returns the list of all timestamps (ms since epoch) encountered (sorted).
         """
         self.chart.removeAllSeries()
-        model = self.shared_config.tracked_data_table_model
+        date_queue_dict = self.shared_config.date_queue_dict
 
-        if len(model._rows) == 0 or len(model._headers) < 2:
+        if not date_queue_dict:
             # Still keep axes; no series present
             return []
 
-        # Find the index of the 'Timestamp' column
-        try:
-            timestamp_index = model._headers.index("Timestamp")
-        except ValueError:
-            # No timestamp column, cannot plot
-            return []
-
         all_ts = []
 
-        # For each non-Timestamp column, build a line series
-        for column_index in range(len(model._headers)):
-            if column_index == timestamp_index:
-                continue  # Skip the 'Timestamp' column
-
+        # For each data point name, build a line series
+        for data_point_name, data_queue in date_queue_dict.items():
             series = QLineSeries()
-            series.setName(model._headers[column_index])  # Use the column header as the series name
-
-            for row in model._rows:
-                timestamp = row[timestamp_index]
-                value = row[column_index]
-                if timestamp is None or value is None:
-                    continue
+            series.setName(data_point_name)  # Use the data point name as the series name
 
+            for timestamp, value in data_queue:
                 # Prefer "yyyy-MM-dd HH:mm:ss.zzz" but also allow without .zzz
                 t_ms = QDateTime.fromString(timestamp, "yyyy-MM-dd HH:mm:ss.zzz").toMSecsSinceEpoch()
                 if t_ms == 0:
                     t_ms = QDateTime.fromString(timestamp, "yyyy-MM-dd HH:mm:ss").toMSecsSinceEpoch()
 
-                if t_ms > 0:
-                    try:
-                        v = float(value)
-                        series.append(t_ms, v)
-                        all_ts.append(t_ms)
-                    except Exception:
-                        # Non-numeric value; skip
-                        pass
+                # Numeric values are stored as floats when recorded; anything else is skipped
+                if t_ms > 0 and isinstance(value, float):
+                    series.append(t_ms, value)
+                    all_ts.append(t_ms)
 
             self.chart.addSeries(series)
 
@@ -294,7 +277,7 @@ class DataViewWindow(QtWidgets.QMainWindow):
         - Advances or holds window end depending on whether user scrolled
         - Updates axis ranges even when there is no data
         """
-        timestamps = self.buildSeriesFromModel()
+        timestamps = self.buildSeriesFromSamples()
 
         # Choose a reference "latest" time: last data timestamp or 'now' if no data
         now_ms = QDateTime.currentMSecsSinceEpoch()
@@ -1,13 +1,110 @@
+import collections
+import itertools
+import sys
+import time
 from PyQt5 import QtWidgets, uic, QtCore, QtGui
-import serial
-from serial.tools import list_ports
-from datetime import datetime
 from com_port.com_port import ComPort
+from com_port.port_scanner import PortScanner
+from com_port.device_watcher import DeviceChangeFilter
 from serial_reader.SerialReaderThread import SerialReaderThread
-from .Data_View_Window import DataViewWindow
+
+try:
+    # Optional Python module generated from 'MainForm.ui' with pyuic5 (see the readme);
+    # importing it is faster than parsing the .ui file at start-up
+    from .ui_main_form import Ui_MainWindow
+except ImportError:
+    class Ui_MainWindow(object):
+        """
+        Fallback for the generated `Ui_MainWindow` that loads the layout from the .ui file.
+        """
+        def setupUi(self, MainWindow):
+            """
+            Loads 'MainForm.ui' into the given window.
+
+            Args:
+                MainWindow (QtWidgets.QMainWindow): The window to build the UI on.
+            """
+            uic.loadUi('UI/MainForm.ui', MainWindow)
+
+# Chevrons framing UI messages in the output text area
+_CHEV_IN = ">" * 7
+_CHEV_OUT = "<" * 7
+# Constant text around the timestamp and text of each message, joined as
+# prefix + timestamp + mid + message (+ suffix for UI messages)
+_UI_PREFIX = '['
+_UI_MID = f'] - {_CHEV_IN} UI Message Start {_CHEV_OUT}\n'
+_UI_SUFFIX = f'\n{_CHEV_IN} UI Message End {_CHEV_OUT}'
+_PORT_PREFIX = '['
+_PORT_MID = '] - '
+
+# Last formatted timestamp as (whole seconds since the epoch, text). Replaced as a whole
+# tuple so a reader always sees a matching pair.
+_timestamp_cache = (0, '')
+
+
+def _format_second(second):
+    """
+    Returns a time in whole seconds since the epoch formatted as local 'YYYY-MM-DD HH:MM:SS'.
+
+    The text only changes once per second, so it is formatted once per second and
+    reused for every call in between.
+
+    Args:
+        second (int): The time in whole seconds since the epoch.
+
+    Returns:
+        str: The formatted time.
+    """
+    global _timestamp_cache
+    cached_second, cached_text = _timestamp_cache
+    if second != cached_second:
+        cached_text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+        _timestamp_cache = (second, cached_text)
+    return cached_text
+
+
+def _timestamp():
+    """
+    Returns the current local time formatted as 'YYYY-MM-DD HH:MM:SS'.
+
+    Returns:
+        str: The formatted timestamp.
+    """
+    return _format_second(int(time.time()))
+
+
+def _timestamp_ms(now):
+    """
+    Returns a time formatted as local 'YYYY-MM-DD HH:MM:SS.mmm'.
+
+    Shares the per-second cache of `_timestamp`, so only the milliseconds are formatted per call.
+
+    Args:
+        now (float): The time in seconds since the epoch, as returned by `time.time()`.
+
+    Returns:
+        str: The formatted timestamp.
+    """
+    second = int(now)
+    return f"{_format_second(second)}.{int((now - second) * 1000):03d}"
+
+# Interval at which queued messages are written to the output text area (milliseconds)
+_OUTPUT_FLUSH_INTERVAL_MS = 50
+# Maximum number of messages kept in the output text area; older ones are discarded
+_OUTPUT_MAX_BLOCKS = 5000
+
+# Interval of the background COM port rescan (milliseconds). On Windows ports are rescanned
+# when a device change is reported, so the timer is only a slow safety net there.
+_PORT_POLL_INTERVAL_MS = 10000 if sys.platform == 'win32' else 2000
+# Delay used to coalesce the burst of device change messages sent for one device (milliseconds)
+_DEVICE_CHANGE_DELAY_MS = 250
+
+# OS-level serial buffer sizes requested on connect (bytes); only honoured on Windows
+_SERIAL_RX_BUFFER_SIZE = 262144
+_SERIAL_TX_BUFFER_SIZE = 65536
 
 # Main Window Class
-class MainWindow(QtWidgets.QMainWindow):
+class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
     """
     MainWindow Class
 
@@ -15,14 +112,15 @@ class MainWindow(QtWidgets.QMainWindow):
 
     Attributes:
         shared_config (SharedConfig): Shared configuration object containing application-wide settings.
-        serial_thread (Thread): Placeholder for the serial reader thread.
+        serial_thread (SerialReaderThread): Placeholder for the serial reader thread.
         port_comboBox (QtWidgets.QComboBox): Dropdown for selecting available COM ports.
         connect_button (QtWidgets.QPushButton): Button to connect to the selected COM port.
         refresh_ports_Button (QtWidgets.QPushButton): Button to refresh the list of available COM ports.
         clear_button (QtWidgets.QPushButton): Button to clear the output text area.
         data_view_button (QtWidgets.QPushButton): Button to open the data view window.
-        output_text (QtWidgets.QTextEdit): Text area for displaying messages and logs.
-        timer (QtCore.QTimer): Timer to periodically check for available COM ports.
+        output_text (QtWidgets.QPlainTextEdit): Text area for displaying messages and logs.
+        timer (QtCore.QTimer): Timer to periodically check for available COM ports; every 2 seconds,
+            or every 10 seconds on Windows where device changes trigger a rescan.
 
     Methods:
         __init__(shared_config):
@@ -48,45 +146,58 @@ class MainWindow(QtWidgets.QMainWindow):
         data_view_button_clicked():
             Opens the data view window.
 
-        get_com_ports(force_refresh=False):
-            Retrieves the list of available COM ports. If force_refresh is True, refreshes the list.
+        scan_com_ports(silent=False):
+            Retrieves the list of available COM ports on a worker thread; the UI is updated when the scan finishes.
+
+        update_com_ports(ports, silent=False):
+            Updates the shared COM port list and the dropdown from an enumerated port list.
+
+        record_data_points(lines):
+            Records the registered data points found in a batch of received lines.
     """
     def __init__(self, shared_config):
         """
         Initializes the MainWindow, sets up the UI, and connects button actions to their handlers.
 
-        - Loads the UI from the 'MainForm.ui' file.
-        - Retrieves and initializes UI elements such as buttons, combo boxes, and text areas.
+        - Builds the UI with the inherited `setupUi`, which comes from the precompiled
+          `views/ui_main_form.py` module if it exists or loads the 'MainForm.ui' file otherwise;
+          both are called on the window itself, so every named widget (port_comboBox,
+          connect_button, output_text, ...) becomes an attribute of the window.
+        - Initializes UI elements such as combo boxes and text areas.
         - Sets up event handlers for button clicks and combo box changes.
-        - Starts a timer to periodically check for available COM ports.
+        - Scans the COM ports in the background and restores the last selected port when the
+          first scan finishes, so the window is shown without waiting for the enumeration.
+        - Starts a timer to periodically check for available COM ports and, on Windows,
+          rescans them when a device is added or removed.
         """
         super(MainWindow, self).__init__()
-        uic.loadUi('UI/MainForm.ui', self)
+        self.setupUi(self)
         font = QtGui.QFont("Arial", 10)
 
         # Initialize shared configuration and serial thread
         self.shared_config = shared_config
         self.serial_thread = None  # Placeholder for the serial reader thread
-
-        # Retrieve available COM ports
-        self.get_com_ports()
-
-        # Initialize UI elements
-        self.port_comboBox = self.findChild(QtWidgets.QComboBox, 'port_comboBox')  
-        # Set the combo box to the last selected port or default to the first item
-        if self.port_comboBox.count() > self.shared_config.last_selected_port:
-            self.port_comboBox.setCurrentIndex(self.shared_config.last_selected_port)
-        else:
-            self.port_comboBox.setCurrentIndex(0)
-
-        self.connect_button = self.findChild(QtWidgets.QPushButton, 'connect_button')
-        self.refresh_ports_Button = self.findChild(QtWidgets.QPushButton, 'refresh_ports_Button')
-        self.clear_button = self.findChild(QtWidgets.QPushButton, 'clear_button')
-        self.data_view_button = self.findChild(QtWidgets.QPushButton, 'data_view_button')
-        self.output_text = self.findChild(QtWidgets.QTextEdit, 'output_text')
+        self._port_scanner = None  # Background port scan in progress, if any
+        self._port_scan_silent = True  # Whether the running scan should report the ports found
+        self._last_port_signature = None  # Sorted (device, hwid) pairs found by the last scan
+        self._restore_port_selection = True  # Select the last used port once the first scan finishes
+        # Messages waiting to be written to the output text area, drained by the log timer.
+        # Bounded like the document itself, since older messages would be discarded anyway.
+        self._log_buf = collections.deque(maxlen=_OUTPUT_MAX_BLOCKS)
+        # Character formats of UI and serial port messages; queued as (format, text) pairs
+        self._ui_format = QtGui.QTextCharFormat()
+        self._ui_format.setForeground(QtGui.QColor('green'))
+        self._port_format = QtGui.QTextCharFormat()
+        self._port_format.setForeground(QtGui.QColor('blue'))
+
+        # Retrieve available COM ports on a worker thread; enumerating them (and loading
+        # pyserial's platform backend on the first scan) then does not delay the window
+        self.scan_com_ports()
 
         # Set font for the output text area
         self.output_text.setFont(font)
+        # Bound the scrollback so appends do not slow down as the session grows
+        self.output_text.document().setMaximumBlockCount(_OUTPUT_MAX_BLOCKS)
 
         # Connect signals to their handlers
         self.port_comboBox.currentIndexChanged.connect(self.port_changed)
@@ -98,60 +209,129 @@ class MainWindow(QtWidgets.QMainWindow):
         # Serial port placeholder
         self.ser = None
 
-        # Timer to check every 2 seconds if the serial port is open
+        # Timer to rescan the available COM ports in the background
         self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(lambda: self.get_com_ports(True))
-        self.timer.start(2000)
-        
+        self.timer.timeout.connect(lambda: self.scan_com_ports(True))
+        self.timer.start(_PORT_POLL_INTERVAL_MS)
+
+        # On Windows, rescan shortly after a device is added or removed
+        self._device_filter = None
+        if sys.platform == 'win32':
+            self._device_change_timer = QtCore.QTimer(self)
+            self._device_change_timer.setSingleShot(True)
+            self._device_change_timer.setInterval(_DEVICE_CHANGE_DELAY_MS)
+            self._device_change_timer.timeout.connect(lambda: self.scan_com_ports(True))
+            self._device_filter = DeviceChangeFilter()  # Must outlive its installation
+            self._device_filter.signals.changed.connect(self._device_change_timer.start)
+            QtCore.QCoreApplication.instance().installNativeEventFilter(self._device_filter)
+
+        # Timer to write queued messages to the output text area in batches
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setInterval(_OUTPUT_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
+
         self.show()
 
     def data_view_button_clicked(self):
         """
         Opens the data view window when the data view button is clicked.
         """
+        # Imported on first use; the data view pulls in QtChart, which is slow to load
+        from .Data_View_Window import DataViewWindow
         self.datawindow = DataViewWindow(self.shared_config)
         
-    def get_com_ports(self, silent=False):
+    def scan_com_ports(self, silent=False):
         """
-        Scans for available COM ports, updates the global `com_ports` dictionary, 
-        and updates the UI with the found ports.
+        Scans for available COM ports on a QThreadPool worker thread.
+
+        `update_com_ports` is called on the GUI thread once the scan finishes. A new scan
+        is not started while the previous one is still running; its result is used instead.
 
         Args:
             silent (bool): If True, suppresses UI messages about found ports.
+        """
+        if self._port_scanner is not None:
+            self._port_scan_silent = self._port_scan_silent and silent
+            return
+        self._port_scan_silent = silent
+        self._port_scanner = PortScanner()  # Keep a reference until the result arrives
+        self._port_scanner.signals.finished.connect(self.port_scan_finished)
+        QtCore.QThreadPool.globalInstance().start(self._port_scanner)
 
-        Functionality:
-            - Uses `list_ports.comports()` to retrieve a list of available COM ports.
-            - Updates the global `com_ports` dictionary and the UI dropdown only if the list of ports has changed.
-            - Restores the previously selected port in the dropdown if it still exists.
-        """
-        ports = list_ports.comports()
-        temp_com_ports = {}
-        portsfound = ""
-        for port in ports:
-            new_port = ComPort(port)
-            temp_com_ports[new_port.UIString] = new_port
-            if not silent:
-                portsfound += f"{new_port.UIString}<br>"
-        if not silent:
-            self.output_UI_message(f"Found {len(ports)} COM ports:<br>{portsfound}")
-        if set(temp_com_ports.keys()) != set(self.shared_config.com_ports.keys()):
-            
-            # Only update if the list of ports has changed
-            self.shared_config.com_ports.clear()
-            self.shared_config.com_ports.update(temp_com_ports)
-            # Block signals to avoid triggering events during updates
+    def port_scan_finished(self, ports):
+        """
+        Receives the result of a background port scan and updates the UI.
+
+        After the first scan at start-up, the combo box is set to the last selected port,
+        or to the first item if that port no longer exists.
+
+        Args:
+            ports (list): The ports returned by `list_ports.comports()`.
+        """
+        self._port_scanner = None
+        self.update_com_ports(ports, self._port_scan_silent)
+
+        if self._restore_port_selection:
+            self._restore_port_selection = False
+            # Set the combo box to the last selected port or default to the first item, without
+            # saving the restored selection back to the settings through port_changed
             self.port_comboBox.blockSignals(True)
-            temp_selected_port = self.port_comboBox.currentText()  # Store the current port text
-            self.port_comboBox.clear()  # Clear the current combo box items
-            self.port_comboBox.addItems(self.shared_config.com_ports.keys()) 
-            # Restore the last selected index
-            if temp_selected_port in self.shared_config.com_ports.keys():
-                temp_selected_index = list(self.shared_config.com_ports.keys()).index(temp_selected_port)
-                self.port_comboBox.setCurrentIndex(temp_selected_index)
+            if self.port_comboBox.count() > self.shared_config.last_selected_port:
+                self.port_comboBox.setCurrentIndex(self.shared_config.last_selected_port)
             else:
                 self.port_comboBox.setCurrentIndex(0)
             self.port_comboBox.blockSignals(False)
-            
+
+    def update_com_ports(self, ports, silent=False):
+        """
+        Updates the global `com_ports` list and the UI from an enumerated port list.
+
+        Args:
+            ports (list): The ports returned by `list_ports.comports()`.
+            silent (bool): If True, suppresses UI messages about found ports.
+
+        Functionality:
+            - Skips the rebuild entirely if the same (device, hwid) pairs were found by the previous scan,
+              without building any ComPort objects.
+            - Otherwise updates the global `com_ports` list and the UI dropdown in place, removing
+              ports that disappeared and appending new ones, so the selected port is kept and
+              `com_ports[i]` is always the port shown at index i of the dropdown.
+        """
+        # Only rebuild if the set of devices has changed since the last scan; the hardware ID is
+        # included so a different device re-enumerated under the same name is picked up too
+        port_signature = tuple(sorted((port.device, port.hwid) for port in ports))
+        if port_signature != self._last_port_signature:
+            self._last_port_signature = port_signature
+
+            temp_com_ports = {}
+            for port in ports:
+                new_port = ComPort(port)
+                temp_com_ports[new_port.UIString] = new_port
+
+            com_ports = self.shared_config.com_ports
+            # Block signals to avoid triggering events during updates
+            self.port_comboBox.blockSignals(True)
+            # Remove ports that are no longer present, last index first so indices stay valid
+            for index in reversed(range(len(com_ports))):
+                if com_ports[index].UIString not in temp_com_ports:
+                    self.port_comboBox.removeItem(index)
+                    del com_ports[index]
+            # Refresh the ports that are still present and append new ones to both lists
+            kept = {port.UIString: index for index, port in enumerate(com_ports)}
+            for ui_string, new_port in temp_com_ports.items():
+                index = kept.get(ui_string)
+                if index is None:
+                    self.port_comboBox.addItem(ui_string)
+                    com_ports.append(new_port)
+                else:
+                    com_ports[index] = new_port
+            self.port_comboBox.blockSignals(False)
+
+        if not silent:
+            portsfound = "\n".join(port.UIString for port in self.shared_config.com_ports)
+            self.output_UI_message(f"Found {len(ports)} COM ports:\n{portsfound}")
+
     def port_changed(self):
         """
         Updates UserConfig with the newly selected COM port index and saves settings.
@@ -168,9 +348,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
         Also displays a message in the UI.
         """
-        if self.serial_thread and self.serial_thread.is_alive():
+        if self.serial_thread and self.serial_thread.isRunning():
             self.serial_thread.stop()
-            self.serial_thread.join()
+            self.serial_thread.wait()
         if self.ser and self.ser.is_open:
             self.ser.close()
         self.output_UI_message("Disconnected from the serial port.")
@@ -179,42 +359,137 @@ class MainWindow(QtWidgets.QMainWindow):
         """
         Refreshes the list of available COM ports in the dropdown.
 
-        Disconnects from the current port if connected, updates the UI, and repopulates the combo box.
+        Disconnects from the current port if connected, updates the UI, and starts a port scan;
+        `update_com_ports` updates the combo box in place if the ports have changed.
         """
         if self.ser and self.ser.is_open:
             self.disconnect_port()
             self.ser = None
         self.output_UI_message("Refreshing COM ports...")
-        self.get_com_ports()
-        self.port_comboBox.clear()
-        self.port_comboBox.addItems(self.shared_config.com_ports.keys())
+        self.scan_com_ports()
 
     def output_UI_message(self, message):
         """
-        Displays a formatted UI message in the output text area and scrolls to the latest entry.
+        Queues a formatted UI message for the output text area.
 
         Args:
             message (str): The message to display in the UI.
         """
-        inChevons = "&gt;&gt;&gt;&gt;&gt;&gt;&gt;"
-        outChevrons = "&lt;&lt;&lt;&lt;&lt;&lt;&lt;"
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        print(f"[{timestamp}]")  # Print to console for debugging
-        ui_message = f'<span style="color:green;">[{timestamp}] - {inChevons} UI Message Start {outChevrons} <br>{message}<br>{inChevons} UI Message End {outChevrons}</span>'
-        self.output_text.append(ui_message)
-        self.output_text.ensureCursorVisible()
+        self._log_buf.append((self._ui_format, ''.join((_UI_PREFIX, _timestamp(), _UI_MID, message, _UI_SUFFIX))))
 
-    def output_Port_message(self, message):
+    def output_Port_messages(self, messages):
         """
-        Displays a formatted message received from the serial port in the output text area and scrolls to the latest entry.
+        Queues a batch of formatted messages received from the serial port for the output text area.
+
+        Connected to the serial reader thread's `linesReady` signal, so it runs on the GUI thread.
+        The messages are written by `_flush_log`.
 
         Args:
-            message (str): The message received from the serial port.
+            messages (list): (received, line) tuples, where `received` is the `time.time()` at
+                which the serial reader thread read the line.
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        ui_message = f'<span style="color:blue;">[{timestamp}] - {message}</span>'
-        self.output_text.append(ui_message)
-        self.output_text.ensureCursorVisible()
+        port_format = self._port_format
+        # _format_second caches the text of the current second, so this stays cheap per line
+        self._log_buf.extend(
+            (port_format, ''.join((_PORT_PREFIX, _format_second(int(received)), _PORT_MID, message)))
+            for received, message in messages)
+
+    def record_data_points(self, lines):
+        """
+        Records the data points found in a batch of lines received from the serial port.
+
+        Connected to the serial reader thread's `linesReady` signal, so the recorded data and
+        the table model are only changed on the GUI thread.
+
+        - A line of the form 'name,value' is recorded if `name` is a registered data point name.
+        - Appends a (timestamp, value) tuple to the shared configuration's date_queue_dict, which
+          the chart plots. Numeric values are stored there as floats; other values are kept as text.
+          The timestamp is the time the serial reader thread read the line, not the time it is handled here.
+        - Each data point name has its own bounded deque, so memory use is capped and
+          the oldest samples are dropped first.
+        - Adds the values of the whole batch to the tracked data table model at once, as the
+          received text, so the table and saved CSV files show exactly what the device sent.
+
+        Args:
+            lines (list): (received, line) tuples, where `received` is the `time.time()` at
+                which the serial reader thread read the line.
+        """
+        # Set lookups, as every received line is checked against the names
+        data_point_names = self.shared_config.dataPointNameSet
+        # Only record if there are data point names available
+        if not data_point_names:
+            return
+
+        date_queue_dict = self.shared_config.date_queue_dict
+        samples = []  # (timestamp, name, value) tuples for the table model
+        for received, line in lines:
+            # Split off the name without building a list; sep is empty if there is no comma
+            found_data_name, sep, rest = line.partition(',')
+            if not sep or found_data_name not in data_point_names:
+                continue
+            # The value is the second field; anything after a further comma is ignored
+            found_data_point = rest.partition(',')[0]
+            found_timestamp = _timestamp_ms(received)
+
+            # Store numbers as floats once here for the chart, so it does not convert them on every redraw
+            try:
+                chart_value = float(found_data_point)
+            except ValueError:
+                chart_value = found_data_point  # Non-numeric values are kept as text
+            datapoint = (found_timestamp, chart_value)
+
+            # Add the datapoint to the deque of found_data_name, creating it on first use
+            data_queue = date_queue_dict.get(found_data_name)
+            if data_queue is None:
+                data_queue = date_queue_dict[found_data_name] = collections.deque(
+                    maxlen=self.shared_config.MAX_SAMPLES_PER_DATA_POINT)
+            data_queue.append(datapoint)
+
+            samples.append((found_timestamp, found_data_name, found_data_point))
+
+        # Update the tracked data table model
+        self.shared_config.tracked_data_table_model.addRows(samples)
+
+    def _flush_log(self):
+        """
+        Writes all queued messages to the output text area and scrolls to the latest entry.
+
+        Called by the log timer. The messages are inserted as plain text inside a single edit
+        block, so the document is laid out once per batch instead of once per message, and
+        each run of consecutive messages with the same format is inserted in one call. The view
+        only follows new output if it was already at the bottom, so reading earlier output
+        is not interrupted.
+
+        While the window is minimized or the output area is hidden nothing is written; the
+        messages stay queued (up to the scrollback limit) and are written on the first tick
+        after the output becomes visible again.
+        """
+        if not self._log_buf or self.isMinimized() or not self.output_text.isVisible():
+            return
+
+        # Take everything queued since the last tick
+        messages = []
+        while self._log_buf:
+            messages.append(self._log_buf.popleft())
+
+        # Check before inserting, since the new text moves the scroll bar maximum
+        scroll_bar = self.output_text.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 4
+
+        document = self.output_text.document()
+        cursor = QtGui.QTextCursor(document)
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.beginEditBlock()
+        for text_format, run in itertools.groupby(messages, key=lambda item: item[0]):
+            if not document.isEmpty():
+                cursor.insertBlock()  # Start on a new line, as appendPlainText does
+            # '\n' starts a new block, so every message gets its own line
+            cursor.insertText('\n'.join(text for _, text in run), text_format)
+        cursor.endEditBlock()
+
+        if at_bottom:
+            self.output_text.moveCursor(QtGui.QTextCursor.End)
+            self.output_text.ensureCursorVisible()
 
     def connect_port(self):
         """
@@ -222,23 +497,37 @@ class MainWindow(QtWidgets.QMainWindow):
 
         Displays connection status or error messages in the UI.
         """
-        selected_port = self.port_comboBox.currentText()
-        port_info = self.shared_config.com_ports.get(selected_port, None)
+        # com_ports is kept in the same order as the dropdown
+        index = self.port_comboBox.currentIndex()
+        com_ports = self.shared_config.com_ports
+        port_info = com_ports[index] if 0 <= index < len(com_ports) else None
+
+        if port_info is None:
+            self.output_UI_message("No COM port selected.")
+            return
 
-        if port_info:
-            self.output_UI_message(f"Port Info:\nDevice: {port_info.device}\nName: {port_info.name}\nDescription: {port_info.description}\n"
+        selected_port = port_info.UIString
+        self.output_UI_message(f"Port Info:\nDevice: {port_info.device}\nName: {port_info.name}\nDescription: {port_info.description}\n"
                        f"HWID: {port_info.hwid}\nVID: {port_info.vid}\nPID: {port_info.pid}\nSerial Number: {port_info.serial_number}\n"
                        f"Location: {port_info.location}\nManufacturer: {port_info.manufacturer}\nProduct: {port_info.product}\n"
                        f"Interface: {port_info.interface}")
-        
-        if not selected_port:
-            self.output_UI_message("No COM port selected.")
-            return
+
+        import serial  # Imported on first use; cached in sys.modules afterwards
 
         try:
-            self.ser = serial.Serial(port_info.name, baudrate=self.shared_config.BAUD_RATE, timeout=1)
+            # Open by device path: on Linux/macOS `name` is only the basename (e.g. ttyACM0)
+            self.ser = serial.Serial(port_info.device, baudrate=self.shared_config.BAUD_RATE, timeout=1)
+            # The default driver buffer (often 4 KiB) fills in a fraction of a second at
+            # high baud rates, so ask for a larger one to ride out brief stalls
+            try:
+                self.ser.set_buffer_size(rx_size=_SERIAL_RX_BUFFER_SIZE, tx_size=_SERIAL_TX_BUFFER_SIZE)
+            except AttributeError:
+                pass  # set_buffer_size() only exists on Windows
             self.output_UI_message(f"Connected to {selected_port} at {self.shared_config.BAUD_RATE} baud.")
-            self.serial_thread = SerialReaderThread(self.shared_config, self.ser, self.output_Port_message)
+            self.serial_thread = SerialReaderThread(self.ser)
+            # Queued so the batches are handled on the GUI thread
+            self.serial_thread.linesReady.connect(self.output_Port_messages, QtCore.Qt.QueuedConnection)
+            self.serial_thread.linesReady.connect(self.record_data_points, QtCore.Qt.QueuedConnection)
             self.serial_thread.start()
         except Exception as e:
             self.output_UI_message(f"Error connecting to {selected_port}: {str(e)}")
@@ -250,5 +539,8 @@ class MainWindow(QtWidgets.QMainWindow):
         Saves user settings and disconnects from the serial port before exiting.
         """
         self.shared_config.app_config.save_user_last_port_settings()
+        if self._device_filter is not None:
+            QtCore.QCoreApplication.instance().removeNativeEventFilter(self._device_filter)
+            self._device_filter = None
         self.disconnect_port()
         self.datawindow.close() if hasattr(self, 'datawindow') else None
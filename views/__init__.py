@@ -1,3 +1,10 @@
 # Optionally, you can expose SerialReaderThread directly in the package namespace
-from .Data_View_Window import DataViewWindow
-from .Main_Window import MainWindow
\ No newline at end of file
+from .Main_Window import MainWindow
+
+
+def __getattr__(name):
+    # DataViewWindow pulls in QtChart, so it is only imported when first accessed
+    if name == 'DataViewWindow':
+        from .Data_View_Window import DataViewWindow
+        return DataViewWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")